@@ -1,12 +1,27 @@
 import os
 import json
+import math
+import uuid
+import hashlib
+import datetime
 import logging
+import threading
 import requests
 import time
-from flask import Flask, render_template, request, redirect, url_for
+from collections import Counter
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+from flask import Flask, render_template, request, redirect, url_for, abort
 
 PAGERDUTY_API_URL = "https://events.pagerduty.com/v2/enqueue"
 GENERATED_FOLDER = 'generated_files'
+DEFAULT_TARGET_RATE = 10000  # events per minute for amplified replays
+DEFAULT_MAX_IN_FLIGHT = 50
+FAILURE_LOG_EVERY = 1000  # log a running count instead of every failed amplified send
+REPLAY_LOG_FOLDER = 'replay_logs'
+RESULTS_PAGE_SIZE = 100
+META_FLUSH_INTERVAL = 5  # seconds between result log flushes during a replay
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
@@ -61,19 +76,302 @@ def prepare_event_payload(event):
     new_event.pop("repeat_schedule", None)
     return new_event
 
-def send_event(payload, routing_key):
-    """Send a single event payload to PagerDuty."""
+class PagedLog:
+    """
+    Append-only JSONL file with a sparse index holding the byte offset of every
+    RESULTS_PAGE_SIZE-th record, so a results page can seek() straight to its first line.
+    """
+
+    def __init__(self, path):
+        self._file = open(path, 'ab')
+        self.records = 0
+        self.offset = 0
+        self.page_offsets = []
+
+    def write(self, line):
+        if self.records % RESULTS_PAGE_SIZE == 0:
+            self.page_offsets.append(self.offset)
+        data = line.encode("utf-8")
+        self._file.write(data)
+        self.offset += len(data)
+        self.records += 1
+
+    def flush(self):
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+    def index(self):
+        return {"records": self.records, "page_offsets": self.page_offsets}
+
+class ResultLog:
+    """
+    Append-only JSONL log of send results for a single replay.
+    Summaries, attempt labels and status codes are stored once in lookup tables in the
+    meta sidecar; each log line is a compact [summary_id, attempt_id, status_id] array,
+    with the response body appended only for failed sends. Failed sends are also
+    written to a separate errors log so the errors view can page without scanning.
+    Overall and per-summary status counts are tallied as records are written, and the
+    meta sidecar is refreshed every META_FLUSH_INTERVAL seconds so an interrupted run
+    still leaves a usable log behind.
+    """
+
+    def __init__(self, org, filename, mode):
+        timestamp = datetime.datetime.now().strftime("%Y%m%d%H%M%S")
+        self.replay_id = f"{timestamp}_{uuid.uuid4().hex[:8]}"
+        self.meta = {
+            "replay_id": self.replay_id,
+            "organization": org,
+            "filename": filename,
+            "mode": mode
+        }
+        self._tables = {"summaries": {}, "attempts": {}, "status_codes": {}}
+        self._counts = Counter()
+        self._summary_counts = {}
+        self._lock = threading.Lock()
+        os.makedirs(REPLAY_LOG_FOLDER, exist_ok=True)
+        self._logs = {
+            "all": PagedLog(result_log_path(self.replay_id)),
+            "errors": PagedLog(result_log_path(self.replay_id, "errors"))
+        }
+        self._last_meta = time.monotonic()
+        self._write_meta()
+
+    def _id(self, table, value):
+        ids = self._tables[table]
+        if value not in ids:
+            ids[value] = len(ids)
+        return ids[value]
+
+    def write(self, summary, attempt, status, response_text=None):
+        with self._lock:
+            record = [self._id("summaries", summary), self._id("attempts", attempt),
+                      self._id("status_codes", status)]
+            error = is_error_status(status)
+            if error:
+                record.append(response_text)
+            line = json.dumps(record, separators=(",", ":")) + "\n"
+            self._logs["all"].write(line)
+            if error:
+                self._logs["errors"].write(line)
+            self._counts[record[2]] += 1
+            self._summary_counts.setdefault(record[0], Counter())[record[2]] += 1
+            if time.monotonic() - self._last_meta >= META_FLUSH_INTERVAL:
+                self._write_meta()
+
+    def close(self, report=None):
+        with self._lock:
+            if report is not None:
+                self.meta["report"] = report
+            self._write_meta()
+            for log in self._logs.values():
+                log.close()
+
+    def _write_meta(self):
+        """Flush the logs, then atomically replace the meta sidecar. Caller holds the lock (or is __init__)."""
+        for log in self._logs.values():
+            log.flush()
+        tables = {name: list(ids) for name, ids in self._tables.items()}
+        statuses, summaries = tables["status_codes"], tables["summaries"]
+        self.meta.update(tables)
+        self.meta["total"] = self._logs["all"].records
+        self.meta["status_counts"] = {str(statuses[s]): n for s, n in self._counts.items()}
+        self.meta["summary_counts"] = {
+            summaries[i]: {str(statuses[s]): n for s, n in counts.items()}
+            for i, counts in self._summary_counts.items()
+        }
+        self.meta["views"] = {view: log.index() for view, log in self._logs.items()}
+        tmp_path = result_meta_path(self.replay_id) + ".tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(self.meta, f)
+        os.replace(tmp_path, result_meta_path(self.replay_id))
+        self._last_meta = time.monotonic()
+
+def result_log_path(replay_id, view="all"):
+    suffix = "" if view == "all" else f".{view}"
+    return os.path.join(REPLAY_LOG_FOLDER, f"{replay_id}{suffix}.jsonl")
+
+def result_meta_path(replay_id):
+    return os.path.join(REPLAY_LOG_FOLDER, f"{replay_id}.json")
+
+def is_error_status(status):
+    """Transport errors are logged as "error"; HTTP 4xx/5xx count as errors too."""
+    return not isinstance(status, int) or status >= 400
+
+def read_result_page(replay_id, meta, view, page):
+    """
+    Return the decoded records for one page of a replay's log. Seeks to the page's
+    indexed byte offset, so the cost does not depend on how far into the run it is.
+    """
+    page_offsets = meta["views"][view]["page_offsets"]
+    if page > len(page_offsets):
+        return []
+    summaries, attempts, statuses = meta["summaries"], meta["attempts"], meta["status_codes"]
+    results = []
+    with open(result_log_path(replay_id, view), 'rb') as f:
+        f.seek(page_offsets[page - 1])
+        for line in islice(f, RESULTS_PAGE_SIZE):
+            record = json.loads(line)
+            if record[0] >= len(summaries) or record[1] >= len(attempts) or record[2] >= len(statuses):
+                # Written after the last meta refresh of an interrupted run
+                break
+            results.append({
+                "summary": summaries[record[0]],
+                "attempt": attempts[record[1]],
+                "status_code": statuses[record[2]],
+                "response": record[3] if len(record) > 3 else None
+            })
+    return results
+
+def send_event(payload, routing_key, endpoint_url=PAGERDUTY_API_URL, session=None):
+    """Send a single event payload to PagerDuty (or a compatible stub endpoint)."""
     headers = {"Content-Type": "application/json"}
     # Add the routing key to the payload
     payload["routing_key"] = routing_key
-    response = requests.post(PAGERDUTY_API_URL, headers=headers, json=payload)
+    client = session or requests
+    response = client.post(endpoint_url, headers=headers, json=payload)
     return response
 
+def expand_scenario(events):
+    """
+    Yield (event, attempt) pairs in the order the regular sender emits them:
+    the initial send followed by every entry of its repeat_schedule.
+    """
+    for event in events:
+        yield event, "initial"
+        for repeat in event.get("repeat_schedule", []):
+            for i in range(repeat.get("repeat_count", 0)):
+                yield event, f"repeat {i+1}"
+
+def derive_dedup_key(event):
+    """Return a stable dedup_key derived from the event's summary and source."""
+    body = event.get("payload", {})
+    seed = f"{body.get('summary', '')}|{body.get('source', '')}"
+    return hashlib.sha1(seed.encode("utf-8")).hexdigest()[:12]
+
+def amplify_payload(event, copy_index, derive_dedup=False):
+    """
+    Build the payload for one copy of an amplified event.
+    source and custom_details are tagged with the copy index. dedup_key is suffixed
+    only when the event already has one, so sends that would each raise their own
+    alert in a normal replay still do; with `derive_dedup` a key is derived from the
+    summary and source instead, which collapses repeats within a copy into one alert.
+    """
+    new_event = prepare_event_payload(event)
+    body = dict(new_event.get("payload", {}))
+    details = dict(body.get("custom_details", {}))
+    details["amplification_copy"] = copy_index
+    body["custom_details"] = details
+    body["source"] = f"{body.get('source', 'pd-demo')}-x{copy_index}"
+    new_event["payload"] = body
+    dedup_key = event.get("dedup_key") or (derive_dedup_key(event) if derive_dedup else None)
+    if dedup_key:
+        new_event["dedup_key"] = f"{dedup_key}-x{copy_index}"
+    return new_event
+
+def amplify_events(events, multiplier, derive_dedup=False):
+    """
+    Lazily yield (summary, attempt, payload) for a scenario multiplied by `multiplier`.
+    Each scenario send is emitted once per copy before moving on, so the storm keeps
+    the shape of the original scenario.
+    """
+    for event, attempt in expand_scenario(events):
+        summary = event.get("payload", {}).get("summary", "N/A")
+        for copy_index in range(multiplier):
+            yield summary, attempt, amplify_payload(event, copy_index, derive_dedup)
+
+def send_open_loop(payloads, routing_key, result_log, target_rate=DEFAULT_TARGET_RATE,
+                   max_in_flight=DEFAULT_MAX_IN_FLIGHT, endpoint_url=PAGERDUTY_API_URL):
+    """
+    Send (summary, attempt, payload) items on a fixed schedule of `target_rate` events
+    per minute, independent of response times. At most `max_in_flight` requests are
+    outstanding; when that limit is reached the scheduler blocks (backpressure) and the
+    shortfall shows up as a lower achieved rate in the returned report. The achieved
+    rate covers the send phase only; time spent waiting for in-flight requests to
+    finish is reported separately as drain time.
+    Per-send results are written to `result_log`; failures are logged to the console
+    only for the first one and then as a count every FAILURE_LOG_EVERY failures.
+    """
+    interval = 60.0 / target_rate
+    slots = threading.BoundedSemaphore(max_in_flight)
+    local = threading.local()
+    failure_lock = threading.Lock()
+    backpressure_waits = 0
+    failures = 0
+
+    def record_failure(summary, attempt, error):
+        nonlocal failures
+        with failure_lock:
+            failures += 1
+            count = failures
+        if count == 1:
+            logging.error(f"Error sending amplified event '{summary}': {error}")
+        elif count % FAILURE_LOG_EVERY == 0:
+            logging.error(f"{count} amplified sends have failed so far")
+        try:
+            result_log.write(summary, attempt, "error", str(error))
+        except Exception as e:
+            logging.error(f"Could not record failed send for '{summary}': {e}")
+
+    def worker(summary, attempt, payload):
+        try:
+            if not hasattr(local, "session"):
+                local.session = requests.Session()
+            response = send_event(payload, routing_key, endpoint_url, session=local.session)
+            result_log.write(summary, attempt, response.status_code, response.text)
+        except Exception as e:
+            # Futures are not kept, so anything not recorded here would be lost
+            record_failure(summary, attempt, e)
+        finally:
+            slots.release()
+
+    sent = 0
+    start = time.monotonic()
+    with ThreadPoolExecutor(max_workers=max_in_flight) as pool:
+        for summary, attempt, payload in payloads:
+            delay = start + sent * interval - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            if not slots.acquire(blocking=False):
+                backpressure_waits += 1
+                slots.acquire()
+            pool.submit(worker, summary, attempt, payload)
+            sent += 1
+        send_duration = time.monotonic() - start
+    duration = time.monotonic() - start
+
+    # N sends on schedule span only N-1 intervals, so count the final slot too;
+    # otherwise short runs would report more than the target rate.
+    achieved_rate = sent / (send_duration + interval) * 60 if sent else 0.0
+    logging.info(f"Amplified replay sent {sent} events in {send_duration:.2f}s "
+                 f"({achieved_rate:.0f}/min, target {target_rate}/min), "
+                 f"drained in {duration - send_duration:.2f}s")
+    if failures:
+        logging.error(f"Amplified replay finished with {failures} failed sends")
+    return {
+        "sent": sent,
+        "duration": duration,
+        "send_duration": send_duration,
+        "drain_duration": duration - send_duration,
+        "target_rate": target_rate,
+        "achieved_rate": achieved_rate,
+        "max_in_flight": max_in_flight,
+        "backpressure_waits": backpressure_waits,
+        "failures": failures
+    }
+
 def event_sender():
     if request.method == 'POST':
         org = request.form.get('organization')
         filename = request.form.get('filename')
         routing_key = request.form.get('routing_key')
+        endpoint_url = request.form.get('endpoint_url') or PAGERDUTY_API_URL
+        mode = request.form.get('mode', 'replay')
+        
+        parsed_url = urlparse(endpoint_url)
+        if parsed_url.scheme not in ('http', 'https') or not parsed_url.netloc:
+            return f"Invalid endpoint URL (expected http:// or https://): {endpoint_url}", 400
         
         # Load the event file
         try:
@@ -82,52 +380,109 @@ def event_sender():
             logging.error(f"Error loading event file: {e}")
             return f"Error loading file: {e}", 500
         
+        if mode == 'amplify':
+            try:
+                multiplier = int(request.form.get('multiplier') or 1)
+                target_rate = float(request.form.get('target_rate') or DEFAULT_TARGET_RATE)
+                max_in_flight = int(request.form.get('max_in_flight') or DEFAULT_MAX_IN_FLIGHT)
+            except ValueError as e:
+                return f"Invalid amplification settings: {e}", 400
+            if multiplier < 1 or not math.isfinite(target_rate) or target_rate <= 0 or max_in_flight < 1:
+                return "Multiplier, target rate and max in-flight must be positive (and finite).", 400
+            derive_dedup = request.form.get('derive_dedup_key') == 'on'
+
+            result_log = ResultLog(org, filename, mode)
+            report = None
+            try:
+                report = send_open_loop(amplify_events(events, multiplier, derive_dedup), routing_key, result_log,
+                                        target_rate, max_in_flight, endpoint_url)
+                report["multiplier"] = multiplier
+            finally:
+                result_log.close(report=report)
+            return redirect(url_for('event_sender_results', replay_id=result_log.replay_id))
+        
         # Process and send each event with delays and repeats
-        results = []
-        for event in events:
-            # Retrieve timing metadata and repeat schedule
-            timing = event.get("timing_metadata", {})
-            schedule_offset = timing.get("schedule_offset", 0)
-            repeat_schedule = event.get("repeat_schedule", [])
-            
-            # Delay sending based on schedule_offset
-            if schedule_offset:
-                logging.info(f"Delaying event send by {schedule_offset} seconds for event: {event.get('payload', {}).get('summary', 'N/A')}")
-                time.sleep(schedule_offset)
-            
-            # Prepare payload after delay
-            payload = prepare_event_payload(event)
-            
-            # Send the initial event
-            response = send_event(payload, routing_key)
-            results.append({
-                "summary": event.get("payload", {}).get("summary", "N/A"),
-                "status_code": response.status_code,
-                "response": response.text,
-                "attempt": "initial"
-            })
-            
-            # Process each repeat schedule entry
-            for repeat in repeat_schedule:
-                repeat_count = repeat.get("repeat_count", 0)
-                repeat_offset = repeat.get("repeat_offset", 0)
-                for i in range(repeat_count):
-                    if repeat_offset:
-                        logging.info(f"Waiting {repeat_offset} seconds before repeat attempt {i+1} for event: {event.get('payload', {}).get('summary', 'N/A')}")
-                        time.sleep(repeat_offset)
-                    response = send_event(payload, routing_key)
-                    results.append({
-                        "summary": event.get("payload", {}).get("summary", "N/A"),
-                        "status_code": response.status_code,
-                        "response": response.text,
-                        "attempt": f"repeat {i+1}"
-                    })
-        return render_template("event_sender_results.html", results=results)
+        result_log = ResultLog(org, filename, mode)
+        try:
+            replay_events(events, routing_key, endpoint_url, result_log)
+        finally:
+            result_log.close()
+        return redirect(url_for('event_sender_results', replay_id=result_log.replay_id))
     
     # For GET, render a form that lets the user select organization, event file, and enter a routing key.
     organizations = list_organizations()
     return render_template("event_sender.html", organizations=organizations)
 
+def send_and_log(payload, routing_key, endpoint_url, result_log, summary, attempt):
+    """Send one replay event and log the result; transport errors are logged as "error"."""
+    try:
+        response = send_event(payload, routing_key, endpoint_url)
+    except requests.RequestException as e:
+        logging.error(f"Error sending event '{summary}' ({attempt}): {e}")
+        result_log.write(summary, attempt, "error", str(e))
+        return
+    result_log.write(summary, attempt, response.status_code, response.text)
+
+def replay_events(events, routing_key, endpoint_url, result_log):
+    """Send each event with its scheduled delays and repeats, logging every result."""
+    for event in events:
+        # Retrieve timing metadata and repeat schedule
+        timing = event.get("timing_metadata", {})
+        schedule_offset = timing.get("schedule_offset", 0)
+        repeat_schedule = event.get("repeat_schedule", [])
+        summary = event.get("payload", {}).get("summary", "N/A")
+        
+        # Delay sending based on schedule_offset
+        if schedule_offset:
+            logging.info(f"Delaying event send by {schedule_offset} seconds for event: {summary}")
+            time.sleep(schedule_offset)
+        
+        # Prepare payload after delay
+        payload = prepare_event_payload(event)
+        
+        # Send the initial event
+        send_and_log(payload, routing_key, endpoint_url, result_log, summary, "initial")
+        
+        # Process each repeat schedule entry
+        for repeat in repeat_schedule:
+            repeat_count = repeat.get("repeat_count", 0)
+            repeat_offset = repeat.get("repeat_offset", 0)
+            for i in range(repeat_count):
+                if repeat_offset:
+                    logging.info(f"Waiting {repeat_offset} seconds before repeat attempt {i+1} for event: {summary}")
+                    time.sleep(repeat_offset)
+                send_and_log(payload, routing_key, endpoint_url, result_log, summary, f"repeat {i+1}")
+
+def event_sender_results(replay_id):
+    """
+    Render one page of a replay's result log alongside its aggregated counts.
+    Query args: page (1-based) and view ("all" or "errors").
+    """
+    view = request.args.get('view', 'all')
+    if view not in ('all', 'errors'):
+        abort(404)
+    if not all(c.isalnum() or c == "_" for c in replay_id):
+        abort(404)
+    if not os.path.exists(result_meta_path(replay_id)) or not os.path.exists(result_log_path(replay_id, view)):
+        abort(404)
+    with open(result_meta_path(replay_id), 'r') as f:
+        meta = json.load(f)
+
+    page = max(request.args.get('page', 1, type=int), 1)
+    results = read_result_page(replay_id, meta, view, page)
+    has_next = page * RESULTS_PAGE_SIZE < meta["views"][view]["records"]
+
+    return render_template(
+        "event_sender_results.html",
+        meta=meta,
+        report=meta.get("report"),
+        summary_counts=meta["summary_counts"],
+        results=results,
+        page=page,
+        has_next=has_next,
+        view=view
+    )
+
 # Route to load event files for a given organization (for use in AJAX or similar)
 
 def get_files(org):
@@ -0,0 +1,55 @@
+import json
+import logging
+import sys
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Minimal stand-in for the PagerDuty Events API v2, for verifying replays offline.
+# Usage: python stub_endpoint.py [port]
+# Then send events with the endpoint URL http://127.0.0.1:<port>/v2/enqueue
+
+DEFAULT_PORT = 8089
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+class StubServer(ThreadingHTTPServer):
+    # The default listen backlog of 5 resets connections under a storm
+    request_queue_size = 1024
+    daemon_threads = True
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    received = 0
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        try:
+            event = json.loads(self.rfile.read(length) or b"{}")
+        except json.JSONDecodeError:
+            self._respond(400, {"status": "invalid event", "message": "Event object is invalid"})
+            return
+        StubHandler.received += 1
+        if StubHandler.received % 1000 == 0:
+            logging.info(f"Stub endpoint received {StubHandler.received} events")
+        self._respond(202, {
+            "status": "success",
+            "message": "Event processed",
+            "dedup_key": event.get("dedup_key", "")
+        })
+
+    def _respond(self, status, body):
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        # Per-request access logs would swamp the console during a storm
+        pass
+
+if __name__ == '__main__':
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_PORT
+    server = StubServer(("127.0.0.1", port), StubHandler)
+    logging.info(f"Stub PagerDuty endpoint listening on http://127.0.0.1:{port}/v2/enqueue")
+    server.serve_forever()